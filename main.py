@@ -6,8 +6,6 @@ Convert images to ASCII art from the command line.
 
 import argparse
 import sys
-from PIL import Image
-from src.converter import AsciiConverter
 from src.constants import CHAR_SETS, DEFAULT_WIDTH, DEFAULT_CHAR_SET
 
 
@@ -22,6 +20,7 @@ Examples:
   python main.py samples/image.jpg --width 150
   python main.py samples/image.jpg --char-set simple
   python main.py samples/image.jpg --width 80 --char-set blocks
+  python main.py samples/animation.gif --render-image --workers 4
 
 Available character sets: {', '.join(CHAR_SETS.keys())}
         """
@@ -64,102 +63,113 @@ Available character sets: {', '.join(CHAR_SETS.keys())}
         help="Enable color output (ANSI colors for terminal)"
     )
     
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of processes used to convert GIF frames (default: 1)"
+    )
+    
     args = parser.parse_args()
     
-    # Auto-detect image width if not specified (use default for terminal, auto for images)
-    width = args.width
-    if args.width == DEFAULT_WIDTH and args.render_image:
-        # For image rendering, auto-detect width from image
-        from PIL import Image
-        try:
-            with Image.open(args.image_path) as img:
-                # Use a percentage of image width, capped at reasonable max
-                # This gives good detail without being excessive
-                auto_width = min(int(img.width * 0.3), 500)  # 30% of image width, max 500
-                width = auto_width
-                print(f"Auto-detected width from image: {img.width}px → {width} characters")
-        except Exception:
-            # Fall back to default if we can't detect
-            width = DEFAULT_WIDTH
+    # Heavy imports (Pillow, NumPy) are deferred until arguments are valid,
+    # so --help and usage errors return immediately
+    from PIL import Image
+    from src.converter import AsciiConverter
     
-    # Create converter with specified options
     try:
-        converter = AsciiConverter(width=width, char_set=args.char_set, use_color=args.color)
-        print(f"Converting {args.image_path}...")
-        print(f"Width: {width} characters, Character set: {args.char_set}")
-        
-        # Check if input is an animated GIF
-        is_animated_gif = converter.is_animated_gif(args.image_path)
-        
-        if is_animated_gif:
-            # Count frames
-            with Image.open(args.image_path) as img:
-                frame_count = 0
-                try:
-                    while True:
-                        frame_count += 1
-                        img.seek(img.tell() + 1)
-                except EOFError:
-                    pass
-            print(f"Detected animated GIF with {frame_count} frames")
-        else:
-            print("-" * 50)
-        
-        # Convert the image or GIF
-        if is_animated_gif:
-            # Process all frames of the GIF
-            frames = converter.convert_gif(args.image_path)
-            print(f"Processed {len(frames)} frames")
-            print("-" * 50)
+        # Open the input once; the same image is used for width detection,
+        # GIF detection and conversion, and its file is closed once output is done
+        with Image.open(args.image_path) as image:
+            # Auto-detect image width if not specified (use default for terminal, auto for images)
+            width = args.width
+            if args.width == DEFAULT_WIDTH and args.render_image:
+                # For image rendering, auto-detect width from image
+                # Use a percentage of image width, capped at reasonable max
+                # This gives good detail without being excessive
+                width = min(int(image.width * 0.3), 500)  # 30% of image width, max 500
+                print(f"Auto-detected width from image: {image.width}px → {width} characters")
             
-            # Output result for GIF
-            if args.render_image:
-                # Render as animated GIF
-                output_img_path = args.output or "ascii_output.gif"
-                
-                # Ensure output path has .gif extension
-                if not output_img_path.endswith('.gif'):
-                    output_img_path = output_img_path.rsplit('.', 1)[0] + '.gif'
-                
-                converter.render_gif_to_images(frames, output_path=output_img_path)
-                print(f"\nAnimated GIF rendered: {output_img_path} ({len(frames)} frames, width: {width} chars)")
-            elif args.output:
-                # Save frames as separate text files
-                base_name = args.output.rsplit('.', 1)[0] if '.' in args.output else args.output
-                for frame in frames:
-                    frame_filename = f"{base_name}_frame_{frame['frame_number']:04d}.txt"
-                    with open(frame_filename, 'w', encoding='utf-8') as f:
-                        f.write(frame['ascii_art'])
-                print(f"\nASCII art saved to {len(frames)} files: {base_name}_frame_*.txt")
+            # Create converter with specified options
+            # Rendered images take their colors from the color data, so skip the ANSI codes
+            converter = AsciiConverter(
+                width=width,
+                char_set=args.char_set,
+                use_color=args.color,
+                ansi_color=not args.render_image,
+            )
+            print(f"Converting {args.image_path}...")
+            print(f"Width: {width} characters, Character set: {args.char_set}")
+            
+            # Check if input is an animated GIF
+            is_animated_gif = converter.is_animated_gif(image)
+            
+            if is_animated_gif:
+                # n_frames counts frames without decoding them
+                frame_count = image.n_frames
+                print(f"Detected animated GIF with {frame_count} frames")
             else:
-                # Print first frame to terminal
-                print("\n" + frames[0]['ascii_art'])
-                if len(frames) > 1:
-                    print(f"\n(Showing first frame only. GIF has {len(frames)} total frames)")
-        else:
-            # Process regular image
-            ascii_art = converter.convert_image(args.image_path)
+                print("-" * 50)
             
-            # Output result
-            if args.render_image:
-                # Render as image
-                output_img_path = args.output or "ascii_output.png"
+            # Convert the image or GIF
+            if is_animated_gif:
+                # With one worker, frames are converted lazily as each output below
+                # consumes them, so only one frame's ASCII art and color data is held
+                # in memory at a time. With more workers every frame is decoded up front
+                # and results are kept until read; rendering to a GIF also keeps every
+                # rendered frame image until the file is written
+                frames = converter.iter_convert_gif(image, workers=args.workers)
+                print("-" * 50)
                 
-                # Pass color_data if color was enabled
-                color_data = getattr(converter, '_last_color_data', None) if args.color else None
-                
-                # Use the width (auto-detected or specified)
-                converter.render_to_image(ascii_art, output_path=output_img_path, color_data=color_data)
-                print(f"\nASCII art rendered as image: {output_img_path} (width: {width} chars)")
-            elif args.output:
-                # Save as text file
-                with open(args.output, 'w', encoding='utf-8') as f:
-                    f.write(ascii_art)
-                print(f"\nASCII art saved to: {args.output}")
+                # Output result for GIF
+                if args.render_image:
+                    # Render as animated GIF
+                    output_img_path = args.output or "ascii_output.gif"
+                    
+                    # Ensure output path has .gif extension
+                    if not output_img_path.endswith('.gif'):
+                        output_img_path = output_img_path.rsplit('.', 1)[0] + '.gif'
+                    
+                    converter.render_gif_to_images(frames, output_path=output_img_path)
+                    print(f"\nAnimated GIF rendered: {output_img_path} ({frame_count} frames, width: {width} chars)")
+                elif args.output:
+                    # Save frames as separate text files
+                    base_name = args.output.rsplit('.', 1)[0] if '.' in args.output else args.output
+                    for frame in frames:
+                        frame_filename = f"{base_name}_frame_{frame['frame_number']:04d}.txt"
+                        with open(frame_filename, 'w', encoding='utf-8') as f:
+                            f.write(frame['ascii_art'])
+                    print(f"\nASCII art saved to {frame_count} files: {base_name}_frame_*.txt")
+                else:
+                    # Print first frame to terminal (only the first frame gets converted)
+                    print("\n" + next(frames)['ascii_art'])
+                    if frame_count > 1:
+                        print(f"\n(Showing first frame only. GIF has {frame_count} total frames)")
             else:
-                # Print to terminal
-                print("\n" + ascii_art)
-            
+                # Process regular image
+                # The image isn't used after this, so a JPEG may be decoded at reduced size
+                ascii_art = converter.convert_pil(image, draft=True)
+                
+                # Output result
+                if args.render_image:
+                    # Render as image
+                    output_img_path = args.output or "ascii_output.png"
+                    
+                    # Pass color_data if color was enabled
+                    color_data = converter._last_color_data if args.color else None
+                    
+                    # Use the width (auto-detected or specified)
+                    converter.render_to_image(ascii_art, output_path=output_img_path, color_data=color_data)
+                    print(f"\nASCII art rendered as image: {output_img_path} (width: {width} chars)")
+                elif args.output:
+                    # Save as text file
+                    with open(args.output, 'w', encoding='utf-8') as f:
+                        f.write(ascii_art)
+                    print(f"\nASCII art saved to: {args.output}")
+                else:
+                    # Print to terminal
+                    print("\n" + ascii_art)
+    
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
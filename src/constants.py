@@ -21,7 +21,6 @@ CHAR_SETS = {
 # Default configuration
 DEFAULT_WIDTH = 100
 DEFAULT_CHAR_SET = "simple"
-DEFAULT_HEIGHT = None  # None means auto-calculate based on aspect ratio
 
 # Aspect ratio correction factor
 # Terminal characters are typically taller than they are wide (~2:1 ratio)
@@ -30,3 +29,9 @@ DEFAULT_HEIGHT = None  # None means auto-calculate based on aspect ratio
 # Typical values: 0.4-0.6 for most terminals
 ASPECT_RATIO_CORRECTION = 0.5
 
+# ANSI 256-color escape codes for the 216-color cube (codes 16-231)
+# Indexed by cube position 36*R + 6*G + B, where R, G, B are levels 0-5
+ANSI_CUBE_COLORS = tuple(f"\033[38;5;{16 + index}m" for index in range(216))
+
+# ANSI escape code that resets the terminal color
+ANSI_RESET = "\033[0m"
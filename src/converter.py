@@ -4,8 +4,131 @@ ASCII Art Converter
 Converts images to ASCII art representation.
 """
 
+from functools import lru_cache
+
+import numpy as np
 from PIL import Image
-from .constants import CHAR_SETS, DEFAULT_WIDTH, DEFAULT_CHAR_SET, ASPECT_RATIO_CORRECTION
+from .constants import (
+    CHAR_SETS, DEFAULT_WIDTH, DEFAULT_CHAR_SET, ASPECT_RATIO_CORRECTION,
+    ANSI_CUBE_COLORS, ANSI_RESET,
+)
+
+
+def _strip_ansi(text: str) -> str:
+    """
+    Remove the ANSI color escape codes written by colored conversion.
+    
+    Every code has the form ESC [ ... m, so splitting on ESC [ and dropping
+    each piece up to its first 'm' removes them without a regex.
+    
+    Args:
+        text: ASCII art string, possibly containing ANSI codes
+        
+    Returns:
+        The string with all escape codes removed
+    """
+    pieces = text.split('\033[')
+    return pieces[0] + ''.join(piece.partition('m')[2] for piece in pieces[1:])
+
+
+@lru_cache(maxsize=None)
+def _char_array(char_set: str) -> np.ndarray:
+    """
+    Build the character array for a character set, shared by all converters.
+    
+    Args:
+        char_set: Name of character set (from constants.CHAR_SETS)
+        
+    Returns:
+        Read-only array of single characters, ordered dark to light
+    """
+    chars = np.array(list(CHAR_SETS[char_set]), dtype='U1')
+    chars.flags.writeable = False
+    return chars
+
+
+@lru_cache(maxsize=None)
+def _char_bytes(char_set: str):
+    """
+    Build the byte values of a character set if every character fits in one byte.
+    
+    Args:
+        char_set: Name of character set (from constants.CHAR_SETS)
+        
+    Returns:
+        Read-only uint8 array of Latin-1 byte values, or None for sets with
+        wider characters (e.g. Unicode block characters)
+    """
+    try:
+        encoded = CHAR_SETS[char_set].encode('latin-1')
+    except UnicodeEncodeError:
+        return None
+    return np.frombuffer(encoded, dtype=np.uint8)
+
+
+@lru_cache(maxsize=128)
+def _target_dims(original_width: int, original_height: int, width: int, aspect_ratio_correction: float) -> tuple:
+    """
+    Calculate the ASCII output dimensions for an image.
+    Maintains aspect ratio with correction for terminal character height.
+    
+    Args:
+        original_width: Width of the source image in pixels
+        original_height: Height of the source image in pixels
+        width: Width of the output ASCII art in characters
+        aspect_ratio_correction: Height compression factor for tall terminal characters
+        
+    Returns:
+        Tuple of (width, height) in characters
+    """
+    # Calculate aspect ratio
+    aspect_ratio = original_height / original_width
+    
+    # Calculate uncorrected height (true aspect ratio)
+    uncorrected_height = int(width * aspect_ratio)
+    
+    # Calculate new height with correction for terminal character aspect ratio
+    # Terminal characters are taller than wide, so we reduce height to compensate
+    new_height = int(width * aspect_ratio * aspect_ratio_correction)
+    
+    # Prevent excessive compression - ensure we keep at least 40% of original height
+    # This prevents important details (like fins) from being lost
+    min_height = max(1, int(uncorrected_height * 0.4))
+    if new_height < min_height:
+        new_height = min_height
+    
+    # Also ensure we don't compress too much - if the compression ratio is extreme,
+    # it means the aspect ratio correction might be wrong for this image
+    compression_ratio = new_height / uncorrected_height if uncorrected_height > 0 else 1.0
+    if compression_ratio < 0.3:  # If we're compressing more than 70%, something's wrong
+        # Use a more conservative correction
+        new_height = int(uncorrected_height * 0.5)  # At least keep 50% of height
+    
+    return width, new_height
+
+
+@lru_cache(maxsize=8)
+def _load_monospace_font(font_size: int):
+    """
+    Load a monospace font for rendering, shared by all renders at this size.
+    
+    Args:
+        font_size: Font size in pixels
+        
+    Returns:
+        PIL font object (the default font if no monospace font is available)
+    """
+    from PIL import ImageFont
+    
+    # Try to use a monospace font, fall back to default if not available
+    try:
+        # Try system monospace font
+        return ImageFont.truetype("/System/Library/Fonts/Menlo.ttc", font_size)
+    except:
+        try:
+            return ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf", font_size)
+        except:
+            return ImageFont.load_default()
 
 
 class AsciiConverter:
@@ -13,7 +136,7 @@ class AsciiConverter:
     Converts images to ASCII art.
     """
     
-    def __init__(self, width: int = DEFAULT_WIDTH, char_set: str = DEFAULT_CHAR_SET, use_color: bool = False) -> None:
+    def __init__(self, width: int = DEFAULT_WIDTH, char_set: str = DEFAULT_CHAR_SET, use_color: bool = False, ansi_color: bool = True) -> None:
         """
         Initialize the ASCII converter.
         
@@ -21,9 +144,13 @@ class AsciiConverter:
             width: Width of the output ASCII art in characters
             char_set: Name of character set to use (from constants.CHAR_SETS)
             use_color: Whether to use color output (ANSI colors for terminal)
+            ansi_color: Whether color output embeds ANSI codes in the ASCII art.
+                        Turn off when the art is only rendered to an image, which
+                        takes its colors from the color data instead
         """
         self.width = width
         self.use_color = use_color
+        self.ansi_color = ansi_color
         
         # Validate and store the character set
         if char_set not in CHAR_SETS:
@@ -32,6 +159,13 @@ class AsciiConverter:
         self.char_set_name = char_set
         self.characters = CHAR_SETS[char_set]
         
+        # Character set as an array so pixels can be mapped in one gather
+        self._chars = _char_array(char_set)
+        self._char_bytes = _char_bytes(char_set)
+        
+        # Color data of the last conversion, kept for render_to_image (None when color is off)
+        self._last_color_data = None
+        
         # Store aspect ratio correction for resizing
         self.aspect_ratio_correction = ASPECT_RATIO_CORRECTION
     
@@ -46,41 +180,76 @@ class AsciiConverter:
         Returns:
             String containing the ASCII art representation
         """
-        # Load the image
+        # Load the image (only used here, so it may be decoded at reduced size)
         image = self._load_image(image_path)
-        original_size = image.size
-        
-        # Resize the image
-        image = self._resize_image(image)
-        resized_size = image.size
         
-        # Initialize color_data
-        color_data = None
+        return self.convert_pil(image, draft=True)
+    
+    
+    def convert_many(self, image_paths, workers: int = 1) -> list:
+        """
+        Convert several image files to ASCII art.
+        Images are independent, so they can be converted in parallel processes.
+        Each image's color data is returned with its ASCII art; _last_color_data
+        is left unchanged.
         
-        # Enhance the image before capturing colors
-        if self.use_color:
-            from PIL import ImageEnhance
+        Args:
+            image_paths: Iterable of paths to image files
+            workers: Number of processes used to convert images (1 = convert in this process)
             
-            # Enhance brightness and sharpness to make colors pop
-            brightened_image = ImageEnhance.Brightness(image).enhance(1.2)  # 20% brighter
-            sharpened_image = ImageEnhance.Sharpness(brightened_image).enhance(1.5)  # 50% sharper
+        Returns:
+            List of (ascii_art, color_data) tuples, in the same order as image_paths,
+            where color_data is None unless color is enabled
+        """
+        image_paths = list(image_paths)
+        
+        if workers > 1 and len(image_paths) > 1:
+            from concurrent.futures import ProcessPoolExecutor
             
-            # Capture colors from the enhanced image
-            color_data = self._capture_color_data(sharpened_image)
+            with ProcessPoolExecutor(max_workers=min(workers, len(image_paths))) as executor:
+                return list(executor.map(self._convert_file, image_paths))
+        
+        return [self._convert_file(image_path) for image_path in image_paths]
+    
+    
+    def _convert_file(self, image_path: str) -> tuple:
+        """
+        Convert one image file to ASCII art without storing its color data.
+        
+        Args:
+            image_path: Path to the image file
             
-            # Boost saturation using HSV
-            color_data = self._boost_saturation(color_data, multiplier=3.0)
+        Returns:
+            Tuple of (ascii_art, color_data), where color_data is None unless color is enabled
+        """
+        # The image is only used here, so it may be decoded at reduced size
+        image = self._resize_image(self._load_image(image_path), draft=True)
+        
+        return self._convert_frame(image)
+    
+    
+    def convert_pil(self, image: Image.Image, draft: bool = False) -> str:
+        """
+        Convert an already opened PIL image to ASCII art.
+        Lets callers that opened the file themselves (e.g. to inspect its size)
+        convert it without reading and decoding it a second time.
+        
+        Args:
+            image: PIL Image object
+            draft: Whether a JPEG that hasn't been loaded yet may be decoded at a
+                   reduced size (and in grayscale when color is off). This changes
+                   the image in place, so only pass True if the image isn't used again
             
-            # Use the enhanced image for character mapping
-            image = sharpened_image
-        else:
-            # Convert to grayscale for B&W image
-            image = self._convert_to_grayscale(image)
-
+        Returns:
+            String containing the ASCII art representation
+        """
+        # Resize the image
+        image = self._resize_image(image, draft=draft)
+        
         # Convert pixels to ASCII characters
         # For terminal: apply ANSI codes if color enabled
         # For image rendering: color_data will be passed separately to render_to_image
-        ascii_art = self._pixels_to_ascii(image, color_data)
+        ascii_art, color_data = self._convert_frame(image)
         
         # Store color_data for potential image rendering (even if ANSI wasn't applied)
         self._last_color_data = color_data
@@ -88,79 +257,100 @@ class AsciiConverter:
         return ascii_art
     
     
-    def convert_gif(self, image_path: str) -> list:
+    def convert_gif(self, image_path, workers: int = 1) -> list:
         """
         Convert an animated GIF file to ASCII art for each frame.
         
         Args:
-            image_path: Path to the GIF file
+            image_path: Path to the GIF file, or an already opened PIL Image of it
+            workers: Number of processes used to convert frames (1 = convert in this process)
             
         Returns:
             List of dictionaries, each containing:
                 - 'ascii_art': String containing the ASCII art representation
-                - 'color_data': List of (R, G, B) tuples (if color enabled)
+                - 'color_data': (H, W, 3) uint8 array of RGB colors (if color enabled)
                 - 'duration': Frame duration in milliseconds
                 - 'frame_number': Frame index (0-based)
         """
-        # Open the GIF
-        gif_image = Image.open(image_path)
+        frames = list(self.iter_convert_gif(image_path, workers=workers))
         
-        frames = []
-        frame_number = 0
+        # Store last frame's color_data for compatibility (if needed)
+        if frames and self.use_color:
+            self._last_color_data = frames[-1]['color_data']
+        
+        return frames
+    
+    
+    def iter_convert_gif(self, image_path, workers: int = 1):
+        """
+        Convert an animated GIF file to ASCII art, yielding one frame at a time.
+        Frames are converted as they are consumed, so callers that write each
+        frame out (or only need the first one) never hold the whole animation.
+        
+        Args:
+            image_path: Path to the GIF file, or an already opened PIL Image of it
+            workers: Number of processes used to convert frames (1 = convert in this process)
+            
+        Yields:
+            Frame dictionaries, as returned in the list from convert_gif
+        """
+        # Open the GIF (unless the caller already has it open)
+        if isinstance(image_path, Image.Image):
+            gif_image = image_path
+            gif_image.seek(0)
+        else:
+            gif_image = Image.open(image_path)
+        
+        # Frames have to be decoded in order (GIF frames may be partial and
+        # build on the previous one); only the small resized copies are kept
+        decoded_frames = self._iter_gif_frames(gif_image)
         
+        # Frames are independent once decoded, so they can be converted in parallel
+        if workers > 1:
+            from concurrent.futures import ProcessPoolExecutor
+            
+            # The pool submits every frame up front, so decode them all first
+            decoded_frames = list(decoded_frames)
+            resized_frames = [frame for frame, _ in decoded_frames]
+            durations = [duration for _, duration in decoded_frames]
+            chunksize = max(1, len(resized_frames) // (workers * 4))
+            
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = executor.map(self._convert_frame, resized_frames, chunksize=chunksize)
+                yield from self._frame_dicts(zip(results, durations))
+        else:
+            converted = (
+                (self._convert_frame(frame), duration)
+                for frame, duration in decoded_frames
+            )
+            yield from self._frame_dicts(converted)
+    
+    
+    def _iter_gif_frames(self, gif_image: Image.Image):
+        """
+        Decode the frames of an open GIF in order, yielding each one resized and in RGB mode.
+        
+        Args:
+            gif_image: Open PIL Image of the GIF
+            
+        Yields:
+            Tuples of (resized RGB PIL Image, frame duration in milliseconds)
+        """
         try:
             while True:
                 # Get frame duration (default to 100ms if not specified)
                 duration = gif_image.info.get('duration', 100)
                 
-                # Process this frame
-                # Create a copy of the frame (important: GIF frames may be partial)
-                frame = gif_image.copy()
+                # Resize first: this creates a new image (important: GIF frames may be
+                # partial) and NEAREST keeps palette indices intact, so the mode
+                # conversion below only has to walk the small resized frame
+                resized_frame = self._resize_image(gif_image)
                 
                 # Convert palette mode (P) or other modes to RGB for processing
-                if frame.mode in ('P', 'RGBA', 'LA'):
-                    frame = frame.convert('RGB')
-                elif frame.mode != 'RGB':
-                    frame = frame.convert('RGB')
-                
-                # Resize the frame
-                resized_frame = self._resize_image(frame)
-                
-                # Initialize color_data
-                color_data = None
+                if resized_frame.mode != 'RGB':
+                    resized_frame = resized_frame.convert('RGB')
                 
-                # Enhance the frame before capturing colors
-                if self.use_color:
-                    from PIL import ImageEnhance
-                    
-                    # Enhance brightness and sharpness to make colors pop
-                    brightened_frame = ImageEnhance.Brightness(resized_frame).enhance(1.2)  # 20% brighter
-                    sharpened_frame = ImageEnhance.Sharpness(brightened_frame).enhance(1.5)  # 50% sharper
-                    
-                    # Capture colors from the enhanced frame
-                    color_data = self._capture_color_data(sharpened_frame)
-                    
-                    # Boost saturation using HSV
-                    color_data = self._boost_saturation(color_data, multiplier=3.0)
-                    
-                    # Use the enhanced frame for character mapping
-                    processed_frame = sharpened_frame
-                else:
-                    # Convert to grayscale for B&W image
-                    processed_frame = self._convert_to_grayscale(resized_frame)
-                
-                # Convert pixels to ASCII characters
-                ascii_art = self._pixels_to_ascii(processed_frame, color_data)
-                
-                # Store frame data
-                frames.append({
-                    'ascii_art': ascii_art,
-                    'color_data': color_data,
-                    'duration': duration,
-                    'frame_number': frame_number
-                })
-                
-                frame_number += 1
+                yield resized_frame, duration
                 
                 # Move to next frame
                 gif_image.seek(gif_image.tell() + 1)
@@ -168,35 +358,90 @@ class AsciiConverter:
         except EOFError:
             # Reached end of GIF
             pass
+    
+    
+    def _frame_dicts(self, converted):
+        """
+        Build the frame dictionaries for converted GIF frames.
         
-        # Store last frame's color_data for compatibility (if needed)
-        if frames and self.use_color:
-            self._last_color_data = frames[-1]['color_data']
+        Args:
+            converted: Iterable of ((ascii_art, color_data), duration) tuples, in frame order
+            
+        Yields:
+            Frame dictionaries with 'ascii_art', 'color_data', 'duration' and 'frame_number'
+        """
+        for frame_number, ((ascii_art, color_data), duration) in enumerate(converted):
+            yield {
+                'ascii_art': ascii_art,
+                'color_data': color_data,
+                'duration': duration,
+                'frame_number': frame_number
+            }
+    
+    
+    def _convert_frame(self, frame: Image.Image) -> tuple:
+        """
+        Convert a single resized image or GIF frame to ASCII art.
         
-        return frames
+        Args:
+            frame: PIL Image object already resized to the output dimensions
+            
+        Returns:
+            Tuple of (ascii_art, color_data), where color_data is None unless color is enabled
+        """
+        # Initialize color_data and the optional tone curve
+        color_data = None
+        tone_curve = None
+        
+        # Enhance the frame before capturing colors
+        if self.use_color:
+            from PIL import ImageEnhance
+            
+            # Enhance brightness and sharpness to make colors pop
+            brightened_frame = ImageEnhance.Brightness(frame).enhance(1.2)  # 20% brighter
+            sharpened_frame = ImageEnhance.Sharpness(brightened_frame).enhance(1.5)  # 50% sharper
+            
+            # Capture colors from the enhanced frame
+            color_data = self._capture_color_data(sharpened_frame)
+            
+            # Use the brightness of the enhanced colors for character mapping
+            processed_frame = self._luminance(color_data)
+            
+            # Boost saturation using HSV
+            color_data = self._boost_saturation(color_data, multiplier=3.0)
+        else:
+            # Convert to grayscale for B&W image, equalized while mapping to characters
+            processed_frame, tone_curve = self._convert_to_grayscale(frame)
+        
+        # Convert pixels to ASCII characters
+        ascii_art = self._pixels_to_ascii(processed_frame, tone_curve)
+        
+        # Color the characters for the terminal
+        if color_data is not None and self.ansi_color:
+            ascii_art = self._apply_ansi(ascii_art, color_data)
+        
+        return ascii_art, color_data
 
     
-    def is_animated_gif(self, image_path: str) -> bool:
+    def is_animated_gif(self, image_path) -> bool:
         """
         Check if the image file is an animated GIF (has multiple frames).
         
         Args:
-            image_path: Path to the image file
+            image_path: Path to the image file, or an already opened PIL Image of it
             
         Returns:
             True if the file is an animated GIF, False otherwise
         """
+        if isinstance(image_path, Image.Image):
+            return image_path.format == 'GIF' and getattr(image_path, 'is_animated', False)
+        
         try:
             with Image.open(image_path) as img:
                 if img.format != 'GIF':
                     return False
-                # Check if GIF is animated by trying to seek to next frame
-                try:
-                    img.seek(1)
-                    return True
-                except EOFError:
-                    # Only one frame, not animated
-                    return False
+                # Pillow checks for a second frame without decoding the first
+                return getattr(img, 'is_animated', False)
         except Exception:
             return False
     
@@ -219,50 +464,35 @@ class AsciiConverter:
             raise ValueError(f"Failed to load image '{image_path}': {e}")
     
     
-    def _resize_image(self, image: Image.Image) -> Image.Image:
+    def _resize_image(self, image: Image.Image, draft: bool = False) -> Image.Image:
         """
         Resize image to target ASCII dimensions.
         Maintains aspect ratio with correction for terminal character height.
         
         Args:
             image: PIL Image object
+            draft: Whether a JPEG may be decoded at reduced size (changes the image in place)
             
         Returns:
             Resized PIL Image object
         """
-        # Get original dimensions
+        # Calculate target dimensions (cached, since every GIF frame has the same size)
         original_width, original_height = image.size
+        new_width, new_height = _target_dims(original_width, original_height, self.width, self.aspect_ratio_correction)
         
-        # Calculate aspect ratio
-        aspect_ratio = original_height / original_width
-        
-        # Calculate uncorrected height (true aspect ratio)
-        uncorrected_height = int(self.width * aspect_ratio)
-        
-        # Calculate new height with correction for terminal character aspect ratio
-        # Terminal characters are taller than wide, so we reduce height to compensate
-        new_height = int(self.width * aspect_ratio * self.aspect_ratio_correction)
-        
-        # Prevent excessive compression - ensure we keep at least 40% of original height
-        # This prevents important details (like fins) from being lost
-        min_height = max(1, int(uncorrected_height * 0.4))
-        if new_height < min_height:
-            new_height = min_height
-        
-        # Also ensure we don't compress too much - if the compression ratio is extreme,
-        # it means the aspect ratio correction might be wrong for this image
-        compression_ratio = new_height / uncorrected_height if uncorrected_height > 0 else 1.0
-        if compression_ratio < 0.3:  # If we're compressing more than 70%, something's wrong
-            # Use a more conservative correction
-            new_height = int(uncorrected_height * 0.5)  # At least keep 50% of height
+        # Let JPEG files decode at a reduced DCT scale (1/2, 1/4, 1/8) that is still
+        # at least the target size, and straight to grayscale when color isn't needed.
+        # This skips most of the decode work for large photos; a no-op for other formats
+        if draft and image.format == 'JPEG':
+            image.draft(None if self.use_color else 'L', (new_width, new_height))
         
         # Resize the image
-        resized_image = image.resize((self.width, new_height), Image.Resampling.NEAREST)
+        resized_image = image.resize((new_width, new_height), Image.Resampling.NEAREST)
         
         return resized_image
     
     
-    def _capture_color_data(self, image: Image.Image) -> list:
+    def _capture_color_data(self, image: Image.Image) -> np.ndarray:
         """
         Capture RGB color data from image before grayscale conversion.
         
@@ -270,7 +500,7 @@ class AsciiConverter:
             image: PIL Image object (RGB/RGBA)
             
         Returns:
-            List of (R, G, B) tuples, one per pixel
+            (H, W, 3) uint8 array of RGB values, one per pixel
         """
         # Ensure image is in RGB mode
         if image.mode != 'RGB':
@@ -278,218 +508,293 @@ class AsciiConverter:
         else:
             rgb_image = image
         
-        # Get all pixel data as a flat list of (R, G, B) tuples
-        pixels = list(rgb_image.getdata())
+        # Read the pixel buffer as an array instead of a list of Python tuples
+        pixels = np.asarray(rgb_image, dtype=np.uint8)
         return pixels
 
         
-    def _boost_saturation(self, color_data: list, multiplier: float = 1.5) -> list:
+    def _luminance(self, color_data: np.ndarray) -> np.ndarray:
         """
-        Boost saturation of RGB colors by converting to HSV, increasing S, and converting back.
+        Compute grayscale brightness directly from captured RGB colors.
+        Uses the same fixed-point ITU-R 601-2 weights as PIL's convert('L'),
+        so the result matches converting the image, without a second pass over it.
         
         Args:
-            color_data: List of (R, G, B) tuples
-            multiplier: Saturation multiplier (1.0 = no change, 1.5 = 50% boost, 2.0 = 100% boost)
+            color_data: (H, W, 3) uint8 array of RGB values
             
         Returns:
-            List of (R, G, B) tuples with boosted saturation
+            (H, W) uint8 array of brightness values (0-255)
         """
-        import colorsys
-        
-        boosted_colors = []
+        weights = np.array([19595, 38470, 7471], dtype=np.uint32)
+        return ((color_data @ weights + 0x8000) >> 16).astype(np.uint8)
+    
+    
+    def _boost_saturation(self, color_data: np.ndarray, multiplier: float = 1.5) -> np.ndarray:
+        """
+        Boost saturation of RGB colors by converting to HSV, increasing S, and converting back.
         
-        for r, g, b in color_data:
-            # Convert RGB (0-255) to normalized RGB (0.0-1.0)
-            r_norm = r / 255.0
-            g_norm = g / 255.0
-            b_norm = b / 255.0
-            
-            # Convert to HSV
-            h, s, v = colorsys.rgb_to_hsv(r_norm, g_norm, b_norm)
-            
-            # Boost saturation (clamp to 0.0-1.0)
-            s_boosted = min(1.0, s * multiplier)
-            
-            # Convert back to RGB
-            r_new, g_new, b_new = colorsys.hsv_to_rgb(h, s_boosted, v)
-            
-            # Convert back to 0-255 range and round
-            r_int = int(round(r_new * 255))
-            g_int = int(round(g_new * 255))
-            b_int = int(round(b_new * 255))
-            
-            # Clamp to valid range
-            r_int = max(0, min(255, r_int))
-            g_int = max(0, min(255, g_int))
-            b_int = max(0, min(255, b_int))
+        Args:
+            color_data: (H, W, 3) uint8 array of RGB values
+            multiplier: Saturation multiplier (1.0 = no change, 1.5 = 50% boost, 2.0 = 100% boost)
             
-            boosted_colors.append((r_int, g_int, b_int))
-        
-        return boosted_colors
+        Returns:
+            (H, W, 3) uint8 array of RGB values with boosted saturation
+        """
+        # Convert RGB (0-255) to normalized RGB (0.0-1.0)
+        rgb = color_data / 255.0
+        r, g, b = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+        
+        # Convert to HSV (same formulas as colorsys.rgb_to_hsv, for every pixel at once)
+        max_c = rgb.max(axis=-1)
+        min_c = rgb.min(axis=-1)
+        range_c = max_c - min_c
+        is_gray = range_c == 0
+        safe_range = np.where(is_gray, 1.0, range_c)
+        safe_max = np.where(is_gray, 1.0, max_c)
+        
+        v = max_c
+        s = np.where(is_gray, 0.0, range_c / safe_max)
+        rc = (max_c - r) / safe_range
+        gc = (max_c - g) / safe_range
+        bc = (max_c - b) / safe_range
+        h = np.select([r == max_c, g == max_c], [bc - gc, 2.0 + rc - bc], default=4.0 + gc - rc)
+        h = (h / 6.0) % 1.0
+        
+        # Boost saturation (clamp to 0.0-1.0)
+        s = np.minimum(1.0, s * multiplier)
+        
+        # Convert back to RGB (same formulas as colorsys.hsv_to_rgb)
+        # Gray pixels have s == 0, where p == q == t == v gives back (v, v, v)
+        h6 = h * 6.0
+        sector = h6.astype(np.int64)
+        f = h6 - sector
+        p = v * (1.0 - s)
+        q = v * (1.0 - s * f)
+        t = v * (1.0 - s * (1.0 - f))
+        sectors = [sector % 6 == i for i in range(6)]
+        r_new = np.select(sectors, [v, q, p, p, t, v])
+        g_new = np.select(sectors, [t, v, v, q, p, p])
+        b_new = np.select(sectors, [p, p, t, v, v, q])
+        
+        # Convert back to 0-255 range, round and clamp to valid range
+        boosted_colors = np.stack([r_new, g_new, b_new], axis=-1)
+        return np.clip(np.round(boosted_colors * 255), 0, 255).astype(np.uint8)
     
     
-    def _rgb_to_ansi(self, r: int, g: int, b: int) -> str:
+    def _ansi_color_indices(self, color_data: np.ndarray) -> np.ndarray:
         """
-        Convert RGB values to ANSI 256-color escape code.
+        Quantize RGB colors to positions in the ANSI 216-color cube.
         
         Args:
-            r: Red value (0-255)
-            g: Green value (0-255)
-            b: Blue value (0-255)
+            color_data: (H, W, 3) uint8 array of RGB values
             
         Returns:
-            ANSI escape code string for the color
+            (H, W) uint8 array of indices into ANSI_CUBE_COLORS (0-215)
         """
         # Map RGB (0-255) to ANSI 256-color palette (216 colors from 16-231)
-        # Formula: 16 + 36*R + 6*G + B where R,G,B are 0-5
-        r6 = int(r / 255 * 5)
-        g6 = int(g / 255 * 5)
-        b6 = int(b / 255 * 5)
-        color_code = 16 + 36 * r6 + 6 * g6 + b6
-        return f"\033[38;5;{color_code}m"
+        # Formula: 36*R + 6*G + B where R,G,B are 0-5 (the code is 16 + index)
+        levels = color_data.astype(np.uint16) * 5 // 255
+        indices = 36 * levels[..., 0] + 6 * levels[..., 1] + levels[..., 2]
+        return indices.astype(np.uint8)
     
     
-    def _convert_to_grayscale(self, image: Image.Image) -> Image.Image:
+    def _convert_to_grayscale(self, image: Image.Image) -> tuple:
         """
-        Convert image to grayscale with histogram equalization for better contrast.
+        Convert image to grayscale and build its histogram equalization curve.
+        
+        The curve is the table ImageOps.equalize() would apply. It is returned
+        rather than applied so _pixels_to_ascii() can fold it into its own
+        brightness → character table and walk the pixels only once.
         
         Args:
             image: PIL Image object
             
         Returns:
-            Grayscale PIL Image object with enhanced contrast
+            Tuple of (grayscale PIL Image object, 256-entry uint8 equalization curve)
         """
         # Convert to grayscale mode ('L' = Luminance)
-        grayscale_image = image.convert('L')
-        
-        # Apply histogram equalization to improve local contrast
-        # This spreads out brightness values and preserves relative differences
-        from PIL import ImageOps
-        equalized_image = ImageOps.equalize(grayscale_image)
+        # Skip the copy when the image already is grayscale (e.g. JPEGs decoded via draft)
+        grayscale_image = image if image.mode == 'L' else image.convert('L')
+        
+        # Histogram equalization spreads out brightness values to improve local
+        # contrast while preserving relative differences (same steps as ImageOps.equalize)
+        histogram = np.array(grayscale_image.histogram(), dtype=np.int64)
+        used_bins = histogram[histogram > 0]
+        step = (int(used_bins.sum()) - int(used_bins[-1])) // 255 if len(used_bins) > 1 else 0
+        
+        if not step:
+            # Too few distinct values to spread out; equalize leaves the image as is
+            curve = np.arange(256)
+        else:
+            counts_below = np.concatenate(([0], np.cumsum(histogram)[:-1]))
+            curve = (step // 2 + counts_below) // step
         
-        return equalized_image
+        return grayscale_image, np.clip(curve, 0, 255).astype(np.uint8)
     
     
-    def _pixels_to_ascii(self, image: Image.Image, color_data: list = None) -> str:
+    def _pixels_to_ascii(self, image, tone_curve: np.ndarray = None) -> str:
         """
         Convert image pixels to ASCII characters.
         Maps brightness values (0-255) to characters in the character set.
-        Optionally applies color using ANSI escape codes.
         
         Args:
-            image: Grayscale PIL Image object
-            color_data: Optional list of (R, G, B) tuples for color (one per pixel)
+            image: Grayscale PIL Image object, or (H, W) uint8 array of brightness values
+            tone_curve: Optional 256-entry uint8 table applied to the brightness
+                        values first (e.g. the histogram equalization curve)
             
         Returns:
-            String containing ASCII art (with ANSI color codes if color_data provided)
+            String containing ASCII art
         """
-        # Get image dimensions
-        width, height = image.size
-        
-        # Convert to grayscale for brightness calculation (even if we have color_data)
+        # Convert to grayscale for brightness calculation
         # This ensures we get single brightness values, not RGB tuples
-        if image.mode != 'L':
-            grayscale_image = image.convert('L')
-        else:
-            grayscale_image = image
+        if isinstance(image, Image.Image) and image.mode != 'L':
+            image = image.convert('L')
         
-        # Get all pixel data as a flat list (brightness values 0-255)
-        pixels = list(grayscale_image.getdata())
+        # Get pixel data as a 2D array of brightness values (0-255)
+        pixels = np.asarray(image, dtype=np.uint8)
+        height, width = pixels.shape
         
         # Normalize brightness range for better contrast
         # Use actual min/max from image instead of 0-255 range
-        min_brightness = min(pixels)
-        max_brightness = max(pixels)
+        min_brightness = int(pixels.min())
+        max_brightness = int(pixels.max())
+        if tone_curve is not None:
+            # The curve never decreases, so the extremes map onto each other
+            min_brightness = int(tone_curve[min_brightness])
+            max_brightness = int(tone_curve[max_brightness])
         brightness_range = max_brightness - min_brightness
         
         # Avoid division by zero
         if brightness_range == 0:
             brightness_range = 1
         
-        # Build ASCII art string row by row
-        ascii_art = []
+        # Build a brightness (0-255) → character lookup table for this image
+        # Bright pixels (high brightness) → sparse characters (high index)
+        # Dark pixels (low brightness) → dense characters (low index)
         num_chars = len(self.characters)
+        levels = np.clip(np.arange(256) - min_brightness, 0, brightness_range)
+        char_indices = levels * (num_chars - 1) // brightness_range
+        if tone_curve is not None:
+            char_indices = char_indices[tone_curve]
+        
+        if self._char_bytes is not None:
+            # Single-byte character sets: gather the characters into one byte buffer
+            # with the row terminators already in place and decode it once
+            # (the last newline is left off)
+            buffer = np.empty((height, width + 1), dtype=np.uint8)
+            buffer[:, width] = ord('\n')
+            np.take(self._char_bytes[char_indices], pixels, out=buffer[:, :width], mode='clip')
+            return buffer.ravel()[:-1].tobytes().decode('latin-1')
+        
+        # Map every pixel to its character in a single vectorized gather
+        chars = self._chars[char_indices][pixels]
+        
+        # Collapse each row of single characters into one string
+        rows = np.ascontiguousarray(chars).view(f'U{width}').ravel()
+        return '\n'.join(rows.tolist())
+    
+    
+    def _apply_ansi(self, ascii_art: str, color_data: np.ndarray) -> str:
+        """
+        Color ASCII art for the terminal using ANSI escape codes.
         
-        for y in range(height):
-            row = []
-            for x in range(width):
-                # Get pixel brightness (0-255)
-                pixel_index = y * width + x
-                brightness = pixels[pixel_index]
-                
-                # Normalize brightness to 0-1 range using actual image min/max
-                normalized = (brightness - min_brightness) / brightness_range
-                
-                # Map normalized brightness to character index (0 to num_chars-1)
-                # Bright pixels (high brightness) → sparse characters (high index)
-                # Dark pixels (low brightness) → dense characters (low index)
-                char_index = int(normalized * (num_chars - 1))
-                
-                # Get the character from the character set
-                char = self.characters[char_index]
-                
-                # Apply color if color_data is provided
-                if color_data and pixel_index < len(color_data):
-                    r, g, b = color_data[pixel_index]
-                    ansi_color = self._rgb_to_ansi(r, g, b)
-                    reset_code = "\033[0m"
-                    char = f"{ansi_color}{char}{reset_code}"
-                
-                row.append(char)
+        Args:
+            ascii_art: ASCII art string without color codes
+            color_data: (H, W, 3) uint8 array of RGB colors (one per character)
+            
+        Returns:
+            String containing ASCII art with ANSI color codes
+        """
+        # Build ASCII art string row by row, applying color per character
+        # Neighbouring pixels often share a color, so an escape code is only
+        # emitted where the color changes, and each row ends with one reset
+        colored_art = []
+        color_indices = self._ansi_color_indices(color_data)
+        width = color_indices.shape[1]
+        
+        for row_chars, row_colors in zip(ascii_art.split('\n'), color_indices):
+            # Split the row into runs of the same color
+            run_starts = np.flatnonzero(np.diff(row_colors)) + 1
+            starts = [0] + run_starts.tolist()
+            ends = run_starts.tolist() + [width]
+            run_colors = row_colors[starts].tolist()
+            
+            row = [
+                ANSI_CUBE_COLORS[color] + row_chars[start:end]
+                for start, end, color in zip(starts, ends, run_colors)
+            ]
+            row.append(ANSI_RESET)
             
             # Add row to ASCII art with newline
-            ascii_art.append(''.join(row))
+            colored_art.append(''.join(row))
         
         # Join all rows with newlines
-        return '\n'.join(ascii_art)
+        return '\n'.join(colored_art)
     
     
-    def render_gif_to_images(self, frames: list, font_size: int = 10, output_path: str = "ascii_output.gif") -> Image.Image:
+    def render_gif_to_images(self, frames, font_size: int = 10, output_path: str = "ascii_output.gif") -> Image.Image:
         """
         Render ASCII art frames as an animated GIF.
+        Frames are rendered lazily as they are consumed, so a generator such as
+        iter_convert_gif never needs its ASCII art held as a list. Pillow's GIF
+        writer still keeps every rendered frame until the file is written.
         
         Args:
-            frames: List of frame dictionaries with 'ascii_art', 'color_data', and 'duration'
+            frames: Iterable of frame dictionaries with 'ascii_art', 'color_data', and 'duration'
             font_size: Font size for rendering (default: 10)
             output_path: Path to save the animated GIF
             
         Returns:
             PIL Image object of the first frame (for compatibility)
         """
-        if not frames:
-            return None
-        
-        # Render each frame as an image
-        rendered_frames = []
-        for frame in frames:
-            frame_img = self.render_to_image(
-                frame['ascii_art'],
-                font_size=font_size,
-                output_path=None,  # Don't save individual frames
-                color_data=frame['color_data']
-            )
-            if frame_img:
-                # Set frame duration in milliseconds (PIL expects ms)
-                duration_ms = frame['duration'] if frame['duration'] > 0 else 100
-                frame_img.info['duration'] = duration_ms
-                rendered_frames.append(frame_img)
+        # Render each frame as an image, lazily
+        rendered_frames = (
+            self._render_gif_frame(frame, font_size)
+            for frame in frames
+        )
+        rendered_frames = (frame_img for frame_img in rendered_frames if frame_img)
         
-        if not rendered_frames:
+        first_frame = next(rendered_frames, None)
+        if first_frame is None:
             return None
         
         # Save as animated GIF
         # Use duration from first frame as default, PIL will use per-frame durations from info
-        rendered_frames[0].save(
+        first_frame.save(
             output_path,
             save_all=True,
-            append_images=rendered_frames[1:],
-            duration=rendered_frames[0].info.get('duration', 100),  # Duration in ms
+            append_images=rendered_frames,
+            duration=first_frame.info.get('duration', 100),  # Duration in ms
             loop=0  # Loop forever
         )
         
-        return rendered_frames[0]
+        return first_frame
+    
     
-    def render_to_image(self, ascii_art: str, font_size: int = 10, output_path: str = "ascii_output.png", color_data: list = None) -> Image.Image:
+    def _render_gif_frame(self, frame: dict, font_size: int) -> Image.Image:
+        """
+        Render a single ASCII art frame for an animated GIF.
+        
+        Args:
+            frame: Frame dictionary with 'ascii_art', 'color_data', and 'duration'
+            font_size: Font size for rendering
+            
+        Returns:
+            PIL Image object with its 'duration' info set, or None if nothing was rendered
+        """
+        frame_img = self.render_to_image(
+            frame['ascii_art'],
+            font_size=font_size,
+            output_path=None,  # Don't save individual frames
+            color_data=frame['color_data']
+        )
+        if frame_img:
+            # Set frame duration in milliseconds (PIL expects ms)
+            duration_ms = frame['duration'] if frame['duration'] > 0 else 100
+            frame_img.info['duration'] = duration_ms
+        return frame_img
+    
+    def render_to_image(self, ascii_art: str, font_size: int = 10, output_path: str = "ascii_output.png", color_data: np.ndarray = None) -> Image.Image:
         """
         Render ASCII art as an image file.
         Useful for debugging proportions without terminal rendering effects.
@@ -499,17 +804,15 @@ class AsciiConverter:
             ascii_art: ASCII art string (may contain ANSI codes if color was used)
             font_size: Font size for rendering (default: 10)
             output_path: Path to save the image
-            color_data: Optional list of (R, G, B) tuples for colored rendering
+            color_data: Optional (H, W, 3) uint8 array of RGB colors for colored rendering
             
         Returns:
             PIL Image object of the rendered ASCII art
         """
-        from PIL import ImageDraw, ImageFont
-        import re
+        from PIL import ImageDraw
         
         # Strip ANSI escape codes from ASCII art string for rendering
-        ansi_escape = re.compile(r'\033\[[0-9;]*m')
-        clean_ascii = ansi_escape.sub('', ascii_art)
+        clean_ascii = _strip_ansi(ascii_art)
         
         # Split into lines
         lines = clean_ascii.split('\n')
@@ -528,35 +831,16 @@ class AsciiConverter:
         img = Image.new('RGB', (width, height), color='white')
         draw = ImageDraw.Draw(img)
         
-        # Try to use a monospace font, fall back to default if not available
-        try:
-            # Try system monospace font
-            font = ImageFont.truetype("/System/Library/Fonts/Menlo.ttc", font_size)
-        except:
-            try:
-                font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf", font_size)
-            except:
-                font = ImageFont.load_default()
+        # Use a monospace font (loaded once per size)
+        font = _load_monospace_font(font_size)
         
         # Draw each character with its color if color_data is provided
-        if color_data:
-            pixel_index = 0
-            char_width_px = int(char_width)
-            char_height_px = int(char_height)
-            
-            for line_idx, line in enumerate(lines):
-                x = 0
-                for char in line:
-                    if pixel_index < len(color_data):
-                        r, g, b = color_data[pixel_index]
-                        color = (r, g, b)
-                    else:
-                        color = 'black'  # Fallback to black if color_data is insufficient
-                    
-                    # Draw each character individually with its color
-                    draw.text((x, line_idx * char_height_px), char, fill=color, font=font)
-                    x += char_width_px
-                    pixel_index += 1
+        if color_data is not None:
+            # Stamp pre-rendered glyphs into the image array instead of
+            # drawing every character separately
+            pixels = np.array(img)
+            self._blit_colored_glyphs(pixels, lines, color_data, font, int(char_width), int(char_height))
+            img = Image.fromarray(pixels)
         else:
             # Draw each line without color (original behavior)
             y = 0
@@ -564,8 +848,100 @@ class AsciiConverter:
                 draw.text((0, y), line, fill='black', font=font)
                 y += int(char_height)
         
+        # The stored color data has been used up; don't keep it alive with the converter
+        if color_data is not None and color_data is self._last_color_data:
+            self._last_color_data = None
+        
         # Save the image only if output_path is provided
         if output_path:
             img.save(output_path)
         return img
+    
+    def _blit_colored_glyphs(self, pixels: np.ndarray, lines: list, color_data: np.ndarray, font, char_width_px: int, char_height_px: int) -> None:
+        """
+        Draw colored characters into an RGB image array.
+        Each distinct character is rasterized once into a grayscale mask, and
+        the masks are blended into the image with the character colors
+        (the same blend Pillow's draw.text uses).
+        
+        Glyphs may reach into neighbouring cells, so the cells are drawn in
+        four passes (by row and column parity) in which no glyphs overlap.
+        
+        Args:
+            pixels: (height, width, 3) uint8 image array, modified in place
+            lines: Lines of text without ANSI codes
+            color_data: (H, W, 3) uint8 array of RGB colors, one per character
+            font: PIL font used for rendering
+            char_width_px: Horizontal distance between characters in pixels
+            char_height_px: Vertical distance between lines in pixels
+        """
+        from PIL import ImageDraw
+        
+        rows = len(lines)
+        columns = max(len(line) for line in lines)
+        if not rows or not columns or not char_width_px or not char_height_px:
+            return
+        
+        # Character grid, padded with spaces (which draw nothing)
+        grid = np.array([list(line.ljust(columns)) for line in lines], dtype='U1')
+        glyphs, glyph_indices = np.unique(grid, return_inverse=True)
+        glyph_indices = glyph_indices.reshape(rows, columns)
+        
+        # Render each glyph once into a tile of 2x2 cells, leaving half a cell of
+        # room above and to the left of its position for overhanging strokes
+        tile_height, tile_width = 2 * char_height_px, 2 * char_width_px
+        pad_y, pad_x = char_height_px // 2, char_width_px // 2
+        masks = np.empty((len(glyphs), tile_height, tile_width), dtype=np.uint16)
+        for index, char in enumerate(glyphs.tolist()):
+            mask = Image.new('L', (tile_width, tile_height), 0)
+            ImageDraw.Draw(mask).text((pad_x, pad_y), char, fill=255, font=font)
+            masks[index] = np.asarray(mask)
+        
+        # Only blend the part of the tiles any glyph actually covers
+        inked_rows = np.flatnonzero(masks.any(axis=(0, 2)))
+        inked_columns = np.flatnonzero(masks.any(axis=(0, 1)))
+        if not len(inked_rows):
+            return
+        ink_top, ink_bottom = inked_rows[0], inked_rows[-1] + 1
+        ink_left, ink_right = inked_columns[0], inked_columns[-1] + 1
+        masks = masks[:, ink_top:ink_bottom, ink_left:ink_right]
+        
+        # One color per character, black where color_data is insufficient
+        colors = np.zeros((rows, columns, 3), dtype=np.uint16)
+        color_rows = min(rows, color_data.shape[0])
+        color_columns = min(columns, color_data.shape[1])
+        colors[:color_rows, :color_columns] = color_data[:color_rows, :color_columns]
+        
+        # Work on a canvas with room for tiles that hang off the image edges
+        height, width = pixels.shape[:2]
+        canvas = np.full(
+            (max((rows + 2) * char_height_px, pad_y + height),
+             max((columns + 2) * char_width_px, pad_x + width), 3),
+            255, dtype=np.uint16,
+        )
+        canvas[pad_y:pad_y + height, pad_x:pad_x + width] = pixels
+        
+        for row_parity in (0, 1):
+            for column_parity in (0, 1):
+                pass_indices = glyph_indices[row_parity::2, column_parity::2]
+                pass_rows, pass_columns = pass_indices.shape
+                if not pass_rows or not pass_columns:
+                    continue
+                
+                # Tiles of this pass sit side by side with no gaps
+                top = row_parity * char_height_px
+                left = column_parity * char_width_px
+                region = canvas[
+                    top:top + pass_rows * tile_height,
+                    left:left + pass_columns * tile_width,
+                ].reshape(pass_rows, tile_height, pass_columns, tile_width, 3)
+                region = region[:, ink_top:ink_bottom, :, ink_left:ink_right]
+                mask = masks[pass_indices].transpose(0, 2, 1, 3)[..., None]
+                ink = colors[row_parity::2, column_parity::2][:, None, :, None, :]
+                
+                # Alpha blend, rounded like Pillow's DIV255
+                blended = region * (255 - mask) + ink * mask + 128
+                region[...] = ((blended >> 8) + blended) >> 8
+        
+        pixels[...] = canvas[pad_y:pad_y + height, pad_x:pad_x + width]
 